@@ -23,6 +23,7 @@
 
 from .Registers import MPURegisters as mpu6050
 from smbus import SMBus
+import struct
 import time
 
 Debug = False  
@@ -322,6 +323,36 @@ class MPU6050:
 
         return {'x': GYRO_XOUT_data, 'y': GYRO_YOUT_data, 'z': GYRO_ZOUT_data}
 
+    def read_raw_burst(self):
+        """
+        Fetches raw accelerometer, temperature and gyroscope counts in a single
+        14 byte block read starting at ACCEL_XOUT_H, so all values belong to the same sample.
+        :return: tuple of signed ints (accel_x, accel_y, accel_z, temp, gyro_x, gyro_y, gyro_z)
+        """
+        data = self.bus.read_i2c_block_data(mpu6050.ADDRESS_DEFAULT, mpu6050.ACCEL_XOUT_H, 14)
+
+        return struct.unpack('>7h', bytes(data))
+
+    def read_raw_average(self, samples: int = 150):
+        """
+        Averages raw accelerometer and gyroscope counts over a number of burst reads
+        :param samples: number of bursts to average
+        :type samples: int
+        :return: dict of averaged raw counts, {'accel': {'x','y','z'}, 'gyro': {'x','y','z'}}
+        """
+        if samples < 1:
+            raise ValueError("samples must be at least 1")
+
+        sums = [0] * 7
+
+        for _ in range(samples):
+            burst = self.read_raw_burst()
+            for i in range(7):
+                sums[i] += burst[i]
+
+        return {'accel': {'x': sums[0] / samples, 'y': sums[1] / samples, 'z': sums[2] / samples},
+                'gyro': {'x': sums[4] / samples, 'y': sums[5] / samples, 'z': sums[6] / samples}}
+
     def self_test(self):
         """
         Self test of MPU6050
@@ -389,6 +420,116 @@ class MPU6050:
 
         return {'diff_x': diff_x, 'diff_y': diff_y, 'diff_z': diff_z}
 
+    def self_test_averaged(self, samples: int = 150, settle: float = 0.05, tolerance: float = 0.14):
+        """
+        Statistical self test of gyroscope and accelerometer.
+
+        Both sensors are tested together: raw counts are averaged over `samples` burst reads
+        with self test disabled and again with it enabled, waiting `settle` seconds after each
+        configuration change. As required by the register map, the test runs at +-250 degrees/second
+        and +-8g, where the self test response is compared against the factory trim values.
+        Like the InvenSense reference self test, the output rate is set to 1kHz (SMPRT_DIV = 0)
+        with DLPF = 1, so the result does not depend on an earlier sample_rate() or configuration().
+        The previous CONFIG, SMPRT_DIV, GYRO_CONFIG and ACCEL_CONFIG registers are restored afterwards.
+
+        The default settle of 50ms is the delay the InvenSense reference driver (inv_mpu.c,
+        test.wait_ms) waits after each self test configuration change; with DLPF = 1 the filter
+        delay is only about 2ms. A burst read is 17 bytes on the bus, about 1.7ms at 100kHz and
+        0.45ms at 400kHz, so with the defaults the test takes 2 * 50ms + 2 * 150 bursts:
+        about 0.6 seconds on the Raspberry Pi default 100kHz I2C bus and about 0.25 seconds at 400kHz.
+
+        :param samples: number of burst reads averaged per state
+        :type samples: int
+        :param settle: seconds to wait after changing the configuration, 0.05 as in the InvenSense reference
+        :type settle: float
+        :param tolerance: maximum allowed change from factory trim, 0.14 = 14%
+        :type tolerance: float
+        Axes whose factory test code is 0 have no factory trim value. For these, 'trim_*' is False,
+        'diff_*' is None and the response is checked against the absolute limits the InvenSense
+        reference driver uses instead (gyro 10 to 105 degrees/second, accel 0.3 to 0.95g);
+        'margin_*' is then the fraction by which the response is inside the nearest limit.
+
+        :raises ValueError: if samples is less than 1
+        :return: dict with overall 'passed' and per sensor 'diff_*', 'margin_*', 'passed_*' and 'trim_*' values
+        """
+        # check before any register is changed
+        if samples < 1:
+            raise ValueError("samples must be at least 1")
+
+        config = self.bus.read_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.CONFIG)
+        sample_rate_divider = self.bus.read_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.SMPRT_DIV)
+        gyro_config = self.bus.read_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.GYRO_CONFIG)
+        accel_config = self.bus.read_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.ACCEL_CONFIG)
+
+        try:
+            # 1kHz output rate with DLPF = 1
+            self.bus.write_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.CONFIG, 0x01)
+            self.bus.write_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.SMPRT_DIV, 0x00)
+
+            # +-250 degrees/second and +-8g, self test disabled
+            self.bus.write_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.GYRO_CONFIG, 0x00)
+            self.bus.write_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.ACCEL_CONFIG, 0x10)
+            time.sleep(settle)
+            value_without_self_test = self.read_raw_average(samples)
+
+            # same ranges, self test enabled on all axes
+            self.bus.write_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.GYRO_CONFIG, 0xE0)
+            self.bus.write_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.ACCEL_CONFIG, 0xF0)
+            time.sleep(settle)
+            value_with_self_test = self.read_raw_average(samples)
+
+            test = self.bus.read_i2c_block_data(mpu6050.ADDRESS_DEFAULT, mpu6050.SELF_TEST_X, 4)
+        finally:
+            self.bus.write_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.CONFIG, config)
+            self.bus.write_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.SMPRT_DIV, sample_rate_divider)
+            self.bus.write_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.GYRO_CONFIG, gyro_config)
+            self.bus.write_byte_data(mpu6050.ADDRESS_DEFAULT, mpu6050.ACCEL_CONFIG, accel_config)
+
+        # XG_TEST is the last 5 bits, XA_TEST is 3 high bits + 2 bits from SELF_TEST_A
+        gyro_test = {'x': test[0] & 0x1F, 'y': test[1] & 0x1F, 'z': test[2] & 0x1F}
+        accel_test = {'x': ((test[0] & 0xE0) >> 3) | ((test[3] >> 4) & 0x03),
+                      'y': ((test[1] & 0xE0) >> 3) | ((test[3] >> 2) & 0x03),
+                      'z': ((test[2] & 0xE0) >> 3) | (test[3] & 0x03)}
+
+        # raw counts at +-250 degrees/second (131 LSB) and +-8g (4096 LSB):
+        # gyro 10 to 105 degrees/second, accel 0.3 to 0.95g
+        absolute_limits = {'gyro': (10*131, 105*131), 'accel': (0.3*4096, 0.95*4096)}
+
+        result = {'passed': True, 'gyro': {}, 'accel': {}}
+
+        for sensor, codes in (('gyro', gyro_test), ('accel', accel_test)):
+            for axis in ('x', 'y', 'z'):
+                self_test_response = value_with_self_test[sensor][axis] - \
+                    value_without_self_test[sensor][axis]
+
+                # factory trim is 0 when the test code is 0, fall back to the absolute
+                # self test response limits of the InvenSense reference driver
+                if codes[axis] == 0:
+                    min_limit, max_limit = absolute_limits[sensor]
+                    diff = None
+                    margin = min(abs(self_test_response)/min_limit - 1,
+                                 1 - abs(self_test_response)/max_limit)
+                    passed = margin >= 0
+                else:
+                    if sensor == 'gyro':
+                        factory_trim_value = self.get_gyro_ft_value(codes[axis])
+                        if axis == 'y':
+                            factory_trim_value = -factory_trim_value
+                    else:
+                        factory_trim_value = self.get_accel_ft_value(codes[axis])
+
+                    diff = (self_test_response-factory_trim_value)/factory_trim_value
+                    margin = tolerance - abs(diff)
+                    passed = margin >= 0
+
+                result[sensor]['diff_' + axis] = diff
+                result[sensor]['margin_' + axis] = margin
+                result[sensor]['passed_' + axis] = passed
+                result[sensor]['trim_' + axis] = codes[axis] != 0
+                result['passed'] = result['passed'] and passed
+
+        return result
+
     def get_gyro_ft_value(self, value=0):
         """
         finds the ft value of the gyroscope
@@ -399,4 +540,4 @@ class MPU6050:
         """
         finds the ft value of the accel
         """
-        return (4096*0.34*pow(0.92, ((value-1)/30)))/0.34
+        return 4096*0.34*pow(0.92/0.34, (value-1)/30)
@@ -38,4 +38,9 @@ class MPURegisters:
 	GYRO_CONFIG = 0x1B # configure gyroscope
 	ACCEL_CONFIG = 0x1C # configure accelerometer
 	ACCEL_XOUT_H = 0x3B # starting address of accelerometer data
-	GYRO_XOUT_H = 0x43 #starting address of gyroscope data
\ No newline at end of file
+	GYRO_XOUT_H = 0x43 #starting address of gyroscope data
+
+	SELF_TEST_X = 0x0D #self test register for X axis (XA_TEST[4:2], XG_TEST)
+	SELF_TEST_Y = 0x0E #self test register for Y axis (YA_TEST[4:2], YG_TEST)
+	SELF_TEST_Z = 0x0F #self test register for Z axis (ZA_TEST[4:2], ZG_TEST)
+	SELF_TEST_A = 0x10 #self test register for accelerometer (XA_TEST[1:0], YA_TEST[1:0], ZA_TEST[1:0])
\ No newline at end of file
@@ -0,0 +1,16 @@
+# Run the averaged self test on your own MPU6050
+
+# Author: Gagan Deepak & Aditya Chaudhary
+# License: MIT License (https://opensource.org/licenses/MIT)
+
+from MPU6050 import MPU6050
+
+# Pass your MPU6050 Address
+mpu = MPU6050.MPU6050(0x68)
+
+# Averages 150 samples per state and restores the previous configuration
+result = mpu.self_test_averaged()
+
+print(f"self test passed: {result['passed']}")
+print(f"gyroscope: {result['gyro']}")
+print(f"accelerometer: {result['accel']}")